@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 import yaml
 
 from .utils.exceptions import ConfigError
+from .utils.utils import YamlLoader
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +31,8 @@ def load_config(config_file: str, content: Optional[Dict[str, Any]] = None) -> D
         else:
             if not os.path.exists(config_file):
                 raise ConfigError("Configuration file not found")
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            with open(config_file, "rb") as f:
+                config = yaml.load(f, Loader=YamlLoader)
     except Exception as e:
         raise ConfigError(f"Failed to load configuration: {str(e)}")
 
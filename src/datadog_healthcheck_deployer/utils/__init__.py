@@ -87,6 +87,7 @@ from .utils import (
     substitute_variables,
 )
 from .validation import (
+    clear_network_caches,
     validate_check_type,
     validate_content_match,
     validate_criteria,
@@ -97,6 +98,7 @@ from .validation import (
     validate_monitor_config,
     validate_monitor_state,
     validate_monitor_type,
+    validate_network_batch,
     validate_notification_channel,
     validate_notify_type,
     validate_ssl_certificate,
@@ -211,6 +213,8 @@ __all__ = [
     "validate_ssl_certificate",
     "validate_dns_record",
     "validate_tcp_connection",
+    "validate_network_batch",
+    "clear_network_caches",
     "validate_content_match",
     "validate_thresholds",
     "validate_variables",
@@ -5,16 +5,28 @@ import json
 import os
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-import requests
 import yaml
 
 from .logging import get_logger
 
+# Safe YAML loader and dumper, using the libyaml bindings when available
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+if TYPE_CHECKING:
+    import requests
+
 logger = get_logger(__name__)
 
+_DURATION_PATTERN = re.compile(r"^(\d+)([smhdw])$")
+
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """Load YAML file.
@@ -30,8 +42,10 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
         yaml.YAMLError: If YAML parsing fails
     """
     try:
-        with open(file_path, "r") as f:
-            return yaml.safe_load(f)
+        # Binary mode lets the parser detect the encoding and read the
+        # stream incrementally instead of decoding it in Python first
+        with open(file_path, "rb") as f:
+            return yaml.load(f, Loader=YamlLoader)
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         raise
@@ -54,7 +68,7 @@ def dump_yaml(data: Dict[str, Any], file_path: str) -> None:
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
     except OSError as e:
         logger.error(f"Failed to write YAML file {file_path}: {str(e)}")
         raise
@@ -92,17 +106,51 @@ def substitute_variables(data: Any, variables: Dict[str, Any]) -> Any:
     Returns:
         Data with variables substituted
     """
-    if isinstance(data, str):
-        for var_name, var_value in variables.items():
-            pattern = f"\\${{{var_name}}}"
-            data = re.sub(pattern, str(var_value), data)
-        return data
-    elif isinstance(data, dict):
-        return {k: substitute_variables(v, variables) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [substitute_variables(item, variables) for item in data]
-    else:
-        return data
+    # Walk the data with an explicit stack instead of recursing, copying each
+    # container before rewriting it so the input is left untouched. Copies are
+    # keyed by id() of the original so shared and self-referencing containers
+    # (e.g. YAML aliases) map to a single copy instead of being walked forever.
+    root = [data]
+    stack = [(root, 0)]
+    copies: Dict[int, Any] = {}
+    while stack:
+        container, key = stack.pop()
+        value = container[key]
+        if isinstance(value, str):
+            container[key] = _substitute_string(value, variables)
+        elif isinstance(value, (dict, list)):
+            copy = copies.get(id(value))
+            if copy is not None:
+                container[key] = copy
+                continue
+            if isinstance(value, dict):
+                copy = dict(value)
+                keys = list(copy)
+            else:
+                copy = list(value)
+                keys = range(len(copy))
+            copies[id(value)] = container[key] = copy
+            stack.extend((copy, k) for k in keys)
+    return root[0]
+
+
+def _substitute_string(value: str, variables: Dict[str, Any]) -> str:
+    """Substitute variables in a single string.
+
+    Args:
+        value: String to process
+        variables: Dictionary of variables
+
+    Returns:
+        String with variables substituted
+    """
+    # Nothing to substitute without variables or a ${...} reference
+    if not variables or "${" not in value:
+        return value
+    for var_name, var_value in variables.items():
+        pattern = f"\\${{{var_name}}}"
+        value = re.sub(pattern, str(var_value), value)
+    return value
 
 
 def validate_url(url: str) -> bool:
@@ -217,7 +265,7 @@ def parse_duration(duration: str) -> int:
     """
     units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
 
-    match = re.match(r"^(\d+)([smhdw])$", duration)
+    match = _DURATION_PATTERN.match(duration)
     if not match:
         raise ValueError(f"Invalid duration format: {duration}")
 
@@ -225,7 +273,7 @@ def parse_duration(duration: str) -> int:
     return int(value) * units[unit]
 
 
-def make_request(method: str, url: str, **kwargs) -> requests.Response:
+def make_request(method: str, url: str, **kwargs) -> "requests.Response":
     """Make HTTP request with retry and logging.
 
     Args:
@@ -239,6 +287,8 @@ def make_request(method: str, url: str, **kwargs) -> requests.Response:
     Raises:
         requests.exceptions.RequestException: If request fails
     """
+    # Imported here so loading configuration does not pay for requests
+    import requests
 
     def _make_request():
         response = requests.request(method, url, **kwargs)
@@ -3,13 +3,16 @@
 import logging
 import re
 import socket
-import ssl
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Dict, Optional, Pattern, Sequence, Tuple, Union
 from urllib.parse import urlparse
 
-import dns.resolver
-
 from .constants import (
+    CACHE_TTL,
     INTERVAL_MAX,
     INTERVAL_MIN,
     LOCATIONS,
@@ -23,8 +26,62 @@ from .constants import (
 )
 from .exceptions import ValidationError
 
+if TYPE_CHECKING:
+    import ssl
+
+    import dns.resolver
+
 logger = logging.getLogger(__name__)
 
+# Frozen sets for membership tests; the constant lists keep the order used in messages
+_CHECK_TYPES = frozenset(VALID_CHECK_TYPES)
+_HTTP_METHODS = frozenset(VALID_HTTP_METHODS)
+_MONITOR_TYPES = frozenset(VALID_MONITOR_TYPES)
+_MONITOR_STATES = frozenset(VALID_MONITOR_STATES)
+_NOTIFY_TYPES = frozenset(VALID_NOTIFY_TYPES)
+_CRITERIA = frozenset(VALID_CRITERIA)
+_LOCATION_REGIONS = {provider: frozenset(regions) for provider, regions in LOCATIONS.items()}
+
+_TAG_PATTERN = re.compile(r"^[a-z0-9_\-\.\/]+$")
+# Newline-separated tag keys and values, all in the _TAG_PATTERN alphabet
+_TAG_BLOB_PATTERN = re.compile(r"[a-z0-9_\-\.\/]+(?:\n[a-z0-9_\-\.\/]+)*")
+
+_VARIABLE_NAME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Plain URLs with a scheme and a non-empty ASCII network location; anything else
+# (leading whitespace, brackets, non-ASCII hosts, bytes) is left to urlparse
+_URL_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://[A-Za-z0-9\-._~%!$&'()*+,;=:@]+(?:[/?#]|\Z)")
+
+# Successful certificate checks: (hostname, port) -> (cache expiry, certificate notAfter)
+_SSL_CERT_CACHE: Dict[Tuple[str, int], Tuple[float, Optional[float]]] = {}
+_SSL_CERT_CACHE_LOCK = threading.Lock()
+# TLS sessions offered for resumption on the next connection to the same endpoint
+_SSL_SESSIONS: Dict[Tuple[str, int], "ssl.SSLSession"] = {}
+
+# DNS lookups: (hostname, record type) -> (cache expiry, error message or None)
+_DNS_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+_DNS_NEGATIVE_TTL = 30  # seconds to remember names that do not exist
+_DNS_LOCK = threading.Lock()
+_dns_resolver = None
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a regular expression, reusing previously compiled patterns.
+
+    Args:
+        pattern: Regular expression pattern
+        flags: Regular expression flags
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
 
 def validate_check_type(check_type: str) -> None:
     """Validate health check type.
@@ -35,7 +92,7 @@ def validate_check_type(check_type: str) -> None:
     Raises:
         ValidationError: If check type is invalid
     """
-    if check_type not in VALID_CHECK_TYPES:
+    if check_type not in _CHECK_TYPES:
         raise ValidationError(
             f"Invalid check type: {check_type}. Must be one of: {', '.join(VALID_CHECK_TYPES)}"
         )
@@ -50,7 +107,7 @@ def validate_http_method(method: str) -> None:
     Raises:
         ValidationError: If method is invalid
     """
-    if method not in VALID_HTTP_METHODS:
+    if method not in _HTTP_METHODS:
         raise ValidationError(
             f"Invalid HTTP method: {method}. Must be one of: {', '.join(VALID_HTTP_METHODS)}"
         )
@@ -65,7 +122,7 @@ def validate_monitor_type(monitor_type: str) -> None:
     Raises:
         ValidationError: If monitor type is invalid
     """
-    if monitor_type not in VALID_MONITOR_TYPES:
+    if monitor_type not in _MONITOR_TYPES:
         raise ValidationError(
             f"Invalid monitor type: {monitor_type}. Must be one of: {', '.join(VALID_MONITOR_TYPES)}"
         )
@@ -80,7 +137,7 @@ def validate_monitor_state(state: str) -> None:
     Raises:
         ValidationError: If state is invalid
     """
-    if state not in VALID_MONITOR_STATES:
+    if state not in _MONITOR_STATES:
         raise ValidationError(
             f"Invalid monitor state: {state}. Must be one of: {', '.join(VALID_MONITOR_STATES)}"
         )
@@ -95,7 +152,7 @@ def validate_notify_type(notify_type: str) -> None:
     Raises:
         ValidationError: If notification type is invalid
     """
-    if notify_type not in VALID_NOTIFY_TYPES:
+    if notify_type not in _NOTIFY_TYPES:
         raise ValidationError(
             f"Invalid notification type: {notify_type}. Must be one of: {', '.join(VALID_NOTIFY_TYPES)}"
         )
@@ -110,35 +167,48 @@ def validate_criteria(criteria: str) -> None:
     Raises:
         ValidationError: If criteria is invalid
     """
-    if criteria not in VALID_CRITERIA:
+    if criteria not in _CRITERIA:
         raise ValidationError(
             f"Invalid success criteria: {criteria}. Must be one of: {', '.join(VALID_CRITERIA)}"
         )
 
 
-def validate_location(location: str) -> None:
-    """Validate location.
+@lru_cache(maxsize=256)
+def _check_location(location: str) -> Optional[str]:
+    """Check a location string against the known providers and regions.
 
     Args:
         location: Location string (e.g., "aws:us-east-1")
 
-    Raises:
-        ValidationError: If location is invalid
+    Returns:
+        Error message if the location is invalid, None otherwise
     """
     try:
         provider, region = location.split(":")
     except ValueError:
-        raise ValidationError(f"Invalid location format: {location}. Must be 'provider:region'")
+        return f"Invalid location format: {location}. Must be 'provider:region'"
 
-    if provider not in LOCATIONS:
-        raise ValidationError(
-            f"Invalid provider: {provider}. Must be one of: {', '.join(LOCATIONS.keys())}"
-        )
+    if provider not in _LOCATION_REGIONS:
+        return f"Invalid provider: {provider}. Must be one of: {', '.join(LOCATIONS.keys())}"
 
-    if region not in LOCATIONS[provider]:
-        raise ValidationError(
-            f"Invalid region {region} for provider {provider}. Must be one of: {', '.join(LOCATIONS[provider])}"
-        )
+    if region not in _LOCATION_REGIONS[provider]:
+        return f"Invalid region {region} for provider {provider}. Must be one of: {', '.join(LOCATIONS[provider])}"
+
+    return None
+
+
+def validate_location(location: str) -> None:
+    """Validate location.
+
+    Args:
+        location: Location string (e.g., "aws:us-east-1")
+
+    Raises:
+        ValidationError: If location is invalid
+    """
+    error = _check_location(location)
+    if error is not None:
+        raise ValidationError(error)
 
 
 def validate_tags(tags: Dict[str, str]) -> None:
@@ -155,12 +225,23 @@ def validate_tags(tags: Dict[str, str]) -> None:
     if missing_tags:
         raise ValidationError(f"Missing required tags: {', '.join(missing_tags)}")
 
-    # Validate tag format
-    tag_pattern = re.compile(r"^[a-z0-9_\-\.\/]+$")
+    # Validate tag format with a single match over all keys and values; walk the
+    # tags one by one only to report which of them is invalid
+    try:
+        blob = "\n".join(chain.from_iterable(tags.items()))
+    except TypeError:
+        blob = None
+    if (
+        blob is not None
+        and blob.count("\n") == 2 * len(tags) - 1
+        and _TAG_BLOB_PATTERN.fullmatch(blob)
+    ):
+        return
+
     for key, value in tags.items():
-        if not tag_pattern.match(key):
+        if not _TAG_PATTERN.match(key):
             raise ValidationError(f"Invalid tag key format: {key}")
-        if not tag_pattern.match(value):
+        if not _TAG_PATTERN.match(value):
             raise ValidationError(f"Invalid tag value format: {value}")
 
 
@@ -191,6 +272,8 @@ def validate_url(url: str) -> None:
         ValidationError: If URL is invalid or inaccessible
     """
     try:
+        if isinstance(url, str) and _URL_PATTERN.match(url):
+            return
         result = urlparse(url)
         if not all([result.scheme, result.netloc]):
             raise ValidationError(f"Invalid URL format: {url}")
@@ -198,30 +281,90 @@ def validate_url(url: str) -> None:
         raise ValidationError(f"Failed to parse URL {url}: {str(e)}")
 
 
-def validate_ssl_certificate(hostname: str, port: int = 443) -> None:
+@lru_cache(maxsize=None)
+def _get_ssl_context() -> "ssl.SSLContext":
+    """Return the shared client SSL context, creating it on first use."""
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def validate_ssl_certificate(hostname: str, port: int = 443, ttl: float = CACHE_TTL) -> None:
     """Validate SSL certificate.
 
+    Successful results are cached per hostname and port for ``ttl`` seconds; within
+    that window only the certificate expiry is re-checked and no connection is made.
+
     Args:
         hostname: Hostname to validate
         port: Port number (default: 443)
+        ttl: Seconds to reuse a successful result (default: CACHE_TTL)
 
     Raises:
         ValidationError: If SSL certificate is invalid
     """
+    key = (hostname, port)
+    with _SSL_CERT_CACHE_LOCK:
+        cached = _SSL_CERT_CACHE.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        not_after = cached[1]
+        if not_after is not None and time.time() >= not_after:
+            raise ValidationError(f"SSL certificate for {hostname}:{port} has expired")
+        return
+
+    # Imported here so callers that never check certificates do not load ssl
+    import ssl
+
+    with _SSL_CERT_CACHE_LOCK:
+        session = _SSL_SESSIONS.get(key)
     try:
-        context = ssl.create_default_context()
+        context = _get_ssl_context()
         with socket.create_connection((hostname, port)) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+            with context.wrap_socket(sock, server_hostname=hostname, session=session) as ssock:
+                if ssock.session is not None:
+                    with _SSL_CERT_CACHE_LOCK:
+                        _SSL_SESSIONS[key] = ssock.session
                 cert = ssock.getpeercert()
                 if not cert:
                     raise ValidationError(f"No SSL certificate found for {hostname}:{port}")
+                not_after = cert.get("notAfter")
+                if not_after is not None:
+                    not_after = ssl.cert_time_to_seconds(not_after)
     except Exception as e:
         raise ValidationError(f"Failed to validate SSL certificate for {hostname}:{port}: {str(e)}")
 
+    with _SSL_CERT_CACHE_LOCK:
+        _SSL_CERT_CACHE[key] = (time.monotonic() + ttl, not_after)
+
+
+def _clear_ssl_certificate_cache() -> None:
+    """Clear cached SSL certificate results, sessions and the shared context."""
+    with _SSL_CERT_CACHE_LOCK:
+        _SSL_CERT_CACHE.clear()
+        _SSL_SESSIONS.clear()
+    _get_ssl_context.cache_clear()
+
+
+def _get_dns_resolver() -> "dns.resolver.Resolver":
+    """Return the shared DNS resolver, creating it on first use."""
+    import dns.resolver
+
+    global _dns_resolver
+    with _DNS_LOCK:
+        if _dns_resolver is None:
+            resolver = dns.resolver.Resolver()
+            resolver.timeout = 5
+            resolver.lifetime = 5
+            _dns_resolver = resolver
+        return _dns_resolver
+
 
 def validate_dns_record(hostname: str, record_type: str = "A") -> None:
     """Validate DNS record.
 
+    Answers are cached for the record's TTL (at most CACHE_TTL seconds); names or
+    records that do not exist are remembered for a shorter period.
+
     Args:
         hostname: Hostname to validate
         record_type: DNS record type (default: A)
@@ -229,16 +372,42 @@ def validate_dns_record(hostname: str, record_type: str = "A") -> None:
     Raises:
         ValidationError: If DNS record is invalid
     """
+    key = (hostname, record_type)
+    with _DNS_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        if cached[1] is not None:
+            raise ValidationError(cached[1])
+        return
+
+    # Imported here so callers that never check DNS records do not load dnspython
+    import dns.resolver
+
     try:
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 5
-        resolver.lifetime = 5
-        resolver.query(hostname, record_type)
+        answer = _get_dns_resolver().query(hostname, record_type)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+        message = f"Failed to resolve DNS record for {hostname} (type {record_type}): {str(e)}"
+        with _DNS_LOCK:
+            _DNS_CACHE[key] = (time.monotonic() + _DNS_NEGATIVE_TTL, message)
+        raise ValidationError(message)
     except Exception as e:
         raise ValidationError(
             f"Failed to resolve DNS record for {hostname} (type {record_type}): {str(e)}"
         )
 
+    rrset = getattr(answer, "rrset", None)
+    ttl = rrset.ttl if rrset is not None else CACHE_TTL
+    with _DNS_LOCK:
+        _DNS_CACHE[key] = (time.monotonic() + min(ttl, CACHE_TTL), None)
+
+
+def _clear_dns_record_cache() -> None:
+    """Clear cached DNS results and drop the shared resolver."""
+    global _dns_resolver
+    with _DNS_LOCK:
+        _DNS_CACHE.clear()
+        _dns_resolver = None
+
 
 def validate_tcp_connection(host: str, port: int) -> None:
     """Validate TCP connection.
@@ -257,6 +426,50 @@ def validate_tcp_connection(host: str, port: int) -> None:
         raise ValidationError(f"Failed to establish TCP connection to {host}:{port}: {str(e)}")
 
 
+def clear_network_caches() -> None:
+    """Clear cached results of the network validations (SSL certificates and DNS)."""
+    _clear_ssl_certificate_cache()
+    _clear_dns_record_cache()
+
+
+_NETWORK_VALIDATORS = {
+    "dns": validate_dns_record,
+    "ssl": validate_ssl_certificate,
+    "tcp": validate_tcp_connection,
+}
+_NETWORK_MAX_WORKERS = 10
+
+
+def validate_network_batch(items: Sequence[Tuple[Any, ...]]) -> None:
+    """Run several network validations concurrently.
+
+    Args:
+        items: Validation specs, each a validation kind followed by its arguments,
+            e.g. ``("dns", host, "A")``, ``("tcp", host, port)`` or ``("ssl", host)``
+
+    Raises:
+        ValidationError: If any validation fails (the first failing item in order is reported)
+    """
+    calls = []
+    for kind, *args in items:
+        validator = _NETWORK_VALIDATORS.get(kind)
+        if validator is None:
+            raise ValidationError(
+                f"Invalid network validation type: {kind}. "
+                f"Must be one of: {', '.join(_NETWORK_VALIDATORS)}"
+            )
+        calls.append((validator, args))
+    if not calls:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_NETWORK_MAX_WORKERS, len(calls))) as executor:
+        futures = [executor.submit(validator, *args) for validator, args in calls]
+    for future in futures:
+        error = future.exception()
+        if error is not None:
+            raise error
+
+
 def validate_content_match(pattern: str) -> None:
     """Validate content match pattern.
 
@@ -267,7 +480,7 @@ def validate_content_match(pattern: str) -> None:
         ValidationError: If pattern is invalid
     """
     try:
-        re.compile(pattern)
+        compile_pattern(pattern)
     except Exception as e:
         raise ValidationError(f"Invalid regular expression pattern: {str(e)}")
 
@@ -305,7 +518,7 @@ def validate_variables(variables: Dict[str, Any]) -> None:
     for key, value in variables.items():
         if not isinstance(key, str):
             raise ValidationError(f"Variable key must be a string: {key}")
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", key):
+        if not _VARIABLE_NAME_PATTERN.match(key):
             raise ValidationError(f"Invalid variable name format: {key}")
         if value is None:
             raise ValidationError(f"Variable value cannot be None: {key}")
@@ -359,9 +572,8 @@ def validate_notification_channel(channel: Dict[str, Any]) -> None:
             raise ValidationError("Email notification channel requires 'addresses' field")
         if not isinstance(channel["addresses"], list):
             raise ValidationError("Email addresses must be a list")
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
         for address in channel["addresses"]:
-            if not email_pattern.match(address):
+            if not _EMAIL_PATTERN.match(address):
                 raise ValidationError(f"Invalid email address: {address}")
 
 
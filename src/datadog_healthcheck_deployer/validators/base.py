@@ -2,13 +2,34 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..utils.exceptions import ValidationError
 from ..utils.logging import LoggerMixin
+from ..utils.validation import compile_pattern
 
 logger = logging.getLogger(__name__)
 
+# Python types for the JSON schema type names used in validator schemas
+_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# Type errors for fields that report something more specific than the generic message
+_FIELD_TYPE_ERRORS = {
+    "variables": "Variables must be a dictionary",
+    "templates": "Templates must be a dictionary",
+    "defaults": "Defaults must be a dictionary",
+}
+
+# Formatted only once a value has failed its enum check
+_ENUM_ERROR = "'{}' is not one of {}"
+
 
 class BaseValidator(ABC, LoggerMixin):
     """Abstract base class for validators."""
@@ -20,6 +41,30 @@ class BaseValidator(ABC, LoggerMixin):
             schema: JSON schema for validation
         """
         self.schema = schema
+        self._required_fields = tuple(schema.get("required", ()))
+        self._required_set = frozenset(self._required_fields)
+        self._field_checks = self._build_field_checks(schema.get("properties", {}))
+
+    @staticmethod
+    def _build_field_checks(
+        properties: Dict[str, Dict[str, Any]],
+    ) -> List[Tuple[str, Dict[str, Any], Any, str, Any]]:
+        """Resolve the per-field schema lookups done by validate() once.
+
+        Args:
+            properties: Schema properties
+
+        Returns:
+            List of (field, field schema, expected type, type error, item type) tuples,
+            in schema order
+        """
+        checks = []
+        for field, field_schema in properties.items():
+            expected_type = _SCHEMA_TYPES.get(field_schema.get("type"))
+            type_error = _FIELD_TYPE_ERRORS.get(field, f"Invalid type for field {field}")
+            item_type = _SCHEMA_TYPES.get(field_schema.get("items", {}).get("type"))
+            checks.append((field, field_schema, expected_type, type_error, item_type))
+        return checks
 
     def validate(self, data: Dict[str, Any], strict: bool = False) -> None:
         """Validate data against schema.
@@ -32,75 +77,42 @@ class BaseValidator(ABC, LoggerMixin):
             ValidationError: If validation fails
         """
         # Validate required fields first
-        if "required" in self.schema:
-            self._validate_required_fields(data, self.schema["required"])
+        if self._required_fields:
+            self._validate_required_fields(data)
 
         # Validate properties
-        if "properties" in self.schema:
-            for field, field_schema in self.schema["properties"].items():
-                if field in data:
-                    # Validate type
-                    if "type" in field_schema:
-                        type_map = {
-                            "string": str,
-                            "integer": int,
-                            "number": (int, float),
-                            "boolean": bool,
-                            "array": list,
-                            "object": dict,
-                        }
-                        expected_type = type_map.get(field_schema["type"])
-                        if expected_type:
-                            if not isinstance(data[field], expected_type):
-                                if field == "variables":
-                                    raise ValidationError("Variables must be a dictionary")
-                                elif field == "templates":
-                                    raise ValidationError("Templates must be a dictionary")
-                                elif field == "defaults":
-                                    raise ValidationError("Defaults must be a dictionary")
-                                else:
-                                    raise ValidationError(f"Invalid type for field {field}")
-
-                    # Validate enum
-                    if "enum" in field_schema:
-                        if data[field] not in field_schema["enum"]:
-                            enum_values = field_schema["enum"]
-                            if field == "method":
-                                raise ValidationError(
-                                    f"'{data[field]}' is not one of {enum_values}"
-                                )
-                            elif field == "type":
-                                raise ValidationError(
-                                    f"'{data[field]}' is not one of {enum_values}"
-                                )
-                            elif field == "record_type":
-                                raise ValidationError(
-                                    f"'{data[field]}' is not one of {enum_values}"
-                                )
-                            else:
-                                raise ValidationError(
-                                    f"'{data[field]}' is not one of {enum_values}"
-                                )
-
-                    # Validate minimum length
-                    if "minLength" in field_schema:
-                        if len(data[field]) < field_schema["minLength"]:
-                            raise ValidationError(f"Field {field} is too short")
-
-                    # Validate minimum value
-                    if "minimum" in field_schema:
-                        if data[field] < field_schema["minimum"]:
-                            raise ValidationError(f"Field {field} is too small")
-
-                    # Validate array items
-                    if "items" in field_schema:
-                        if not isinstance(data[field], list):
-                            raise ValidationError(f"Field {field} must be a list")
-                        for item in data[field]:
-                            if "type" in field_schema["items"]:
-                                expected_type = type_map.get(field_schema["items"]["type"])
-                                if expected_type and not isinstance(item, expected_type):
-                                    raise ValidationError(f"Invalid type for item in {field}")
+        for field, field_schema, expected_type, type_error, item_type in self._field_checks:
+            if field not in data:
+                continue
+            value = data[field]
+
+            # Validate type
+            if expected_type and not isinstance(value, expected_type):
+                raise ValidationError(type_error)
+
+            # Validate enum
+            if "enum" in field_schema:
+                if value not in field_schema["enum"]:
+                    raise ValidationError(_ENUM_ERROR.format(value, field_schema["enum"]))
+
+            # Validate minimum length
+            if "minLength" in field_schema:
+                if len(value) < field_schema["minLength"]:
+                    raise ValidationError(f"Field {field} is too short")
+
+            # Validate minimum value
+            if "minimum" in field_schema:
+                if value < field_schema["minimum"]:
+                    raise ValidationError(f"Field {field} is too small")
+
+            # Validate array items
+            if "items" in field_schema:
+                if not isinstance(value, list):
+                    raise ValidationError(f"Field {field} must be a list")
+                if item_type:
+                    for item in value:
+                        if not isinstance(item, item_type):
+                            raise ValidationError(f"Invalid type for item in {field}")
 
     @abstractmethod
     def get_defaults(self) -> Dict[str, Any]:
@@ -120,19 +132,29 @@ class BaseValidator(ABC, LoggerMixin):
         """
         pass
 
-    def _validate_required_fields(self, data: Dict[str, Any], fields: List[str]) -> None:
+    def _validate_required_fields(
+        self, data: Dict[str, Any], fields: Optional[List[str]] = None
+    ) -> None:
         """Validate required fields are present.
 
         Args:
             data: Data to validate
-            fields: List of required field names
+            fields: List of required field names (defaults to the schema's required fields)
 
         Raises:
             ValidationError: If required fields are missing
         """
-        missing = [field for field in fields if field not in data]
-        if missing:
-            field = missing[0]  # Report first missing field
+        if fields is None:
+            fields, required = self._required_fields, self._required_set
+        else:
+            required = frozenset(fields)
+        # Subset test on the keys view only probes the required fields; other input
+        # (e.g. a YAML document that is a string or list) falls through to the scan
+        if isinstance(data, dict) and data.keys() >= required:
+            return
+        # Report first missing field
+        field = next((field for field in fields if field not in data), None)
+        if field is not None:
             raise ValidationError(f"'{field}' is a required property")
 
     def _validate_field_type(self, value: Any, expected_type: type, field: str) -> None:
@@ -163,7 +185,7 @@ class BaseValidator(ABC, LoggerMixin):
             ValidationError: If value is not in enum
         """
         if value not in valid_values:
-            raise ValidationError(f"'{value}' is not one of {valid_values}")
+            raise ValidationError(_ENUM_ERROR.format(value, valid_values))
 
     def _validate_range(
         self,
@@ -222,9 +244,7 @@ class BaseValidator(ABC, LoggerMixin):
         Raises:
             ValidationError: If string doesn't match pattern
         """
-        import re
-
-        if not re.match(pattern, value):
+        if not compile_pattern(pattern).match(value):
             raise ValidationError(f"Value for field {field} must match pattern: {pattern}")
 
     def __repr__(self) -> str:
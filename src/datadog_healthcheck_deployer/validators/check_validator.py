@@ -12,6 +12,56 @@ from ..utils.exceptions import ValidationError
 from .base import BaseValidator
 
 
+def _validate_port(port: Any) -> None:
+    """Validate a port number."""
+    if not isinstance(port, int) or port < 1 or port > 65535:
+        raise ValidationError(f"Invalid port: {port}")
+
+
+def _validate_http(data: Dict[str, Any]) -> None:
+    """Validate HTTP check specific fields."""
+    if "url" not in data:
+        raise ValidationError("URL is required for HTTP check")
+    if "method" in data and data["method"] not in VALID_HTTP_METHODS:
+        raise ValidationError(f"Invalid HTTP method: {data['method']}")
+
+
+def _validate_ssl(data: Dict[str, Any]) -> None:
+    """Validate SSL check specific fields."""
+    if "hostname" not in data:
+        raise ValidationError("Hostname is required for SSL check")
+    if "port" in data:
+        _validate_port(data["port"])
+
+
+def _validate_dns(data: Dict[str, Any]) -> None:
+    """Validate DNS check specific fields."""
+    if "hostname" not in data:
+        raise ValidationError("Hostname is required for DNS check")
+    if "record_type" in data:
+        record_type = data["record_type"].upper()
+        if record_type not in VALID_DNS_RECORD_TYPES:
+            raise ValidationError(f"Invalid DNS record type: {record_type}")
+
+
+def _validate_tcp(data: Dict[str, Any]) -> None:
+    """Validate TCP check specific fields."""
+    if "hostname" not in data:
+        raise ValidationError("Hostname is required for TCP check")
+    if "port" not in data:
+        raise ValidationError("Port is required for TCP check")
+    _validate_port(data["port"])
+
+
+# Type-specific validators, looked up by check type
+_TYPE_VALIDATORS = {
+    "http": _validate_http,
+    "ssl": _validate_ssl,
+    "dns": _validate_dns,
+    "tcp": _validate_tcp,
+}
+
+
 class CheckValidator(BaseValidator):
     """Validator for health check configurations."""
 
@@ -47,7 +97,7 @@ class CheckValidator(BaseValidator):
             ValidationError: If validation fails
         """
         # First validate required fields
-        super()._validate_required_fields(data, ["name", "type"])
+        super()._validate_required_fields(data)
 
         # Validate check type
         check_type = data.get("type", "").lower()
@@ -55,34 +105,9 @@ class CheckValidator(BaseValidator):
             raise ValidationError(f"Invalid check type: {check_type}")
 
         # Validate type-specific fields first
-        if check_type == "http":
-            if "url" not in data:
-                raise ValidationError("URL is required for HTTP check")
-            if "method" in data and data["method"] not in VALID_HTTP_METHODS:
-                raise ValidationError(f"Invalid HTTP method: {data['method']}")
-        elif check_type == "ssl":
-            if "hostname" not in data:
-                raise ValidationError("Hostname is required for SSL check")
-            if "port" in data:
-                port = data["port"]
-                if not isinstance(port, int) or port < 1 or port > 65535:
-                    raise ValidationError(f"Invalid port: {port}")
-        elif check_type == "dns":
-            if "hostname" not in data:
-                raise ValidationError("Hostname is required for DNS check")
-            if "record_type" in data:
-                record_type = data["record_type"].upper()
-                if record_type not in VALID_DNS_RECORD_TYPES:
-                    raise ValidationError(f"Invalid DNS record type: {record_type}")
-        elif check_type == "tcp":
-            if "hostname" not in data:
-                raise ValidationError("Hostname is required for TCP check")
-            if "port" not in data:
-                raise ValidationError("Port is required for TCP check")
-            if "port" in data:
-                port = data["port"]
-                if not isinstance(port, int) or port < 1 or port > 65535:
-                    raise ValidationError(f"Invalid port: {port}")
+        type_validator = _TYPE_VALIDATORS.get(check_type)
+        if type_validator is not None:
+            type_validator(data)
 
         # Then validate the rest of the fields
         super().validate(data, strict)
@@ -1,5 +1,6 @@
 """Validator for configuration files."""
 
+from collections import Counter
 from typing import Any, Dict, List
 
 from ..utils.exceptions import ValidationError
@@ -48,11 +49,15 @@ class ConfigValidator(BaseValidator):
         # For MVP, we allow empty healthchecks list
         healthchecks = data.get("healthchecks", [])
 
-        # Check for duplicate check names
-        check_names = [check.get("name") for check in healthchecks]
-        duplicates = {name for name in check_names if check_names.count(name) > 1}
-        if duplicates:
-            raise ValidationError(f"Duplicate check names found: {', '.join(duplicates)}")
+        # Check for duplicate check names, stopping at the first repeat
+        seen = set()
+        for check in healthchecks:
+            name = check.get("name")
+            if name in seen:
+                counts = Counter(c.get("name") for c in healthchecks)
+                duplicates = [n for n, count in counts.items() if count > 1]
+                raise ValidationError(f"Duplicate check names found: {', '.join(duplicates)}")
+            seen.add(name)
 
         # Validate variables
         variables = data.get("variables", {})
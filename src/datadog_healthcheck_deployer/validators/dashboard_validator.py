@@ -5,6 +5,31 @@ from typing import Any, Dict, List
 from ..utils.exceptions import ValidationError
 from .base import BaseValidator
 
+_WIDGET_TYPES = frozenset(
+    [
+        "timeseries",
+        "query_value",
+        "toplist",
+        "change",
+        "event_stream",
+        "event_timeline",
+        "free_text",
+        "iframe",
+        "image",
+        "note",
+        "check_status",
+        "group",
+        "hostmap",
+        "service_map",
+        "distribution",
+        "alert_graph",
+        "alert_value",
+        "trace_service",
+        "slo",
+        "monitor_summary",
+    ]
+)
+
 
 class DashboardValidator(BaseValidator):
     """Validator for dashboard configurations."""
@@ -69,29 +94,6 @@ class DashboardValidator(BaseValidator):
         Raises:
             ValidationError: If widgets are invalid
         """
-        valid_types = [
-            "timeseries",
-            "query_value",
-            "toplist",
-            "change",
-            "event_stream",
-            "event_timeline",
-            "free_text",
-            "iframe",
-            "image",
-            "note",
-            "check_status",
-            "group",
-            "hostmap",
-            "service_map",
-            "distribution",
-            "alert_graph",
-            "alert_value",
-            "trace_service",
-            "slo",
-            "monitor_summary",
-        ]
-
         for widget in widgets:
             if not isinstance(widget, dict):
                 raise ValidationError("Widget must be an object")
@@ -100,7 +102,7 @@ class DashboardValidator(BaseValidator):
             if not widget_type:
                 raise ValidationError("Widget type is required")
 
-            if widget_type not in valid_types:
+            if not isinstance(widget_type, str) or widget_type not in _WIDGET_TYPES:
                 raise ValidationError(f"Invalid widget type: {widget_type}")
 
             if widget_type != "free_text" and "title" not in widget:
@@ -40,7 +40,10 @@ MOCK_DATA = {
 @pytest.fixture
 def mock_datadog_api():
     """Create mock Datadog API."""
-    with patch("datadog_healthcheck_deployer.checks.base.api") as mock_api:
+    # The check modules bind datadog.api at import, so patch those references
+    with patch("datadog_healthcheck_deployer.checks.base.api") as mock_api, patch(
+        "datadog_healthcheck_deployer.checks.http.api", mock_api
+    ):
         mock_api.Synthetics = MagicMock()
         mock_api.Synthetics.get_test.return_value = None
         mock_api.Synthetics.create_test.return_value = {"public_id": "test-id"}
@@ -48,10 +51,10 @@ def mock_datadog_api():
 
 
 @pytest.fixture
-def mock_env():
+def mock_env(monkeypatch):
     """Mock environment variables."""
-    with patch.dict("os.environ", {"DD_API_KEY": "test-key", "DD_APP_KEY": "test-key"}):
-        yield
+    monkeypatch.setenv("DD_API_KEY", "test-key")
+    monkeypatch.setenv("DD_APP_KEY", "test-key")
 
 
 @pytest.fixture
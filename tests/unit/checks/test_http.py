@@ -1,7 +1,5 @@
 """Tests for the HTTP check implementation."""
 
-from unittest.mock import patch
-
 import pytest
 
 from datadog_healthcheck_deployer.checks.http import HTTPCheck
@@ -138,9 +136,8 @@ def test_http_check_update(mock_datadog_api):
     # Mock existing check
     mock_datadog_api.Synthetics.get_test.return_value = {"name": "test-http"}
 
-    with patch("datadog.api", mock_datadog_api):
-        check.deploy(force=True)
-        mock_datadog_api.Synthetics.update_test.assert_called_once()
+    check.deploy(force=True)
+    mock_datadog_api.Synthetics.update_test.assert_called_once()
 
 
 def test_http_check_get_results(mock_datadog_api):
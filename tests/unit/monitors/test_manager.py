@@ -1,5 +1,6 @@
 """Tests for monitor manager implementation."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -29,11 +30,7 @@ def manager():
 @pytest.fixture
 def mock_check():
     """Create a mock check."""
-    check = MagicMock()
-    check.name = "test-check"
-    check.type = "http"
-    check.tags = ["env:test", "service:test"]
-    return check
+    return SimpleNamespace(name="test-check", type="http", tags=["env:test", "service:test"])
 
 
 @pytest.fixture
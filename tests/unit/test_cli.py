@@ -51,6 +51,7 @@ def test_cli_help(runner):
     assert "Usage:" in result.output
 
 
+@pytest.mark.integration
 def test_cli_deploy(runner, mock_deployer, tmp_path, valid_config):
     """Test deploy command."""
     config_file = tmp_path / "config.yaml"
@@ -63,6 +64,7 @@ def test_cli_deploy(runner, mock_deployer, tmp_path, valid_config):
     )
 
 
+@pytest.mark.integration
 def test_cli_deploy_with_check(runner, mock_deployer, tmp_path, valid_config):
     """Test deploy command with specific check."""
     config_file = tmp_path / "config.yaml"
@@ -75,6 +77,7 @@ def test_cli_deploy_with_check(runner, mock_deployer, tmp_path, valid_config):
     )
 
 
+@pytest.mark.integration
 def test_cli_validate(runner, mock_deployer, tmp_path, valid_config):
     """Test validate command."""
     config_file = tmp_path / "config.yaml"
@@ -129,6 +132,7 @@ def test_cli_missing_config(runner):
     assert result.exit_code == 2  # File not found error code
 
 
+@pytest.mark.integration
 def test_cli_deploy_error(runner, mock_deployer, tmp_path, valid_config):
     """Test deploy command error handling."""
     config_file = tmp_path / "config.yaml"
@@ -140,6 +144,7 @@ def test_cli_deploy_error(runner, mock_deployer, tmp_path, valid_config):
     assert "Deploy failed" in result.output
 
 
+@pytest.mark.integration
 def test_cli_validate_error(runner, mock_deployer, tmp_path, valid_config):
     """Test validate command error handling."""
     config_file = tmp_path / "config.yaml"
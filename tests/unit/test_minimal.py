@@ -1,7 +1,5 @@
 """Minimal test suite for core functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
 from datadog_healthcheck_deployer.checks.http import HTTPCheck
@@ -9,6 +7,7 @@ from datadog_healthcheck_deployer.core import HealthCheckDeployer
 from datadog_healthcheck_deployer.utils.exceptions import DeployerError
 
 
+@pytest.mark.integration
 def test_http_check_deploy(mock_datadog_api):
     """Test basic HTTP check deployment."""
     config = {
@@ -18,22 +17,23 @@ def test_http_check_deploy(mock_datadog_api):
         "locations": ["aws:us-east-1"],
     }
     check = HTTPCheck(config)
-
-    with patch("datadog.api", mock_datadog_api):
-        check.deploy()
-        mock_datadog_api.Synthetics.create_test.assert_called_once()
+    check.deploy()
+    mock_datadog_api.Synthetics.create_test.assert_called_once()
 
 
-def test_core_initialization():
+def test_core_initialization(mocker, monkeypatch):
     """Test core deployer initialization."""
-    with patch.dict("os.environ", {"DD_API_KEY": "test-key", "DD_APP_KEY": "test-key"}):
-        with patch("datadog_healthcheck_deployer.core.initialize") as mock_init:
-            HealthCheckDeployer()
-            mock_init.assert_called_once()
+    monkeypatch.setenv("DD_API_KEY", "test-key")
+    monkeypatch.setenv("DD_APP_KEY", "test-key")
+    mock_init = mocker.patch("datadog_healthcheck_deployer.core.initialize")
+
+    HealthCheckDeployer()
+    mock_init.assert_called_once()
 
 
-def test_missing_credentials():
+def test_missing_credentials(monkeypatch):
     """Test initialization without credentials."""
-    with patch.dict("os.environ", clear=True):
-        with pytest.raises(DeployerError, match="DataDog API and application keys are required"):
-            HealthCheckDeployer()
+    monkeypatch.delenv("DD_API_KEY", raising=False)
+    monkeypatch.delenv("DD_APP_KEY", raising=False)
+    with pytest.raises(DeployerError, match="DataDog API and application keys are required"):
+        HealthCheckDeployer()
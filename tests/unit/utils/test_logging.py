@@ -1,6 +1,8 @@
 """Tests for logging utilities."""
 
-from unittest.mock import MagicMock, patch
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -13,65 +15,72 @@ from datadog_healthcheck_deployer.utils.logging import (
 )
 
 
-def test_setup_logging():
-    """Test logging setup."""
-    mock_handler = MagicMock()
-    with patch("logging.getLogger") as mock_get_logger, patch(
-        "logging.StreamHandler", return_value=mock_handler
-    ) as mock_stream_handler:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
+@pytest.fixture
+def mock_logging(mocker):
+    """Patch logger and handler construction."""
+    mocks = SimpleNamespace(
+        logger=MagicMock(), stream_handler=MagicMock(), file_handler=MagicMock()
+    )
+    get_real_logger = logging.getLogger
 
-        setup_logging(level="INFO")
+    def get_logger_side_effect(name=None):
+        # pytest's log capturing also calls getLogger() while the patch is active
+        if name and name.startswith("datadog_healthcheck_deployer"):
+            return mocks.logger
+        return get_real_logger(name)
 
-        mock_stream_handler.assert_called_once()
-        mock_logger.addHandler.assert_called_once_with(mock_handler)
-        mock_logger.setLevel.assert_called_once()
+    mocks.get_logger = mocker.patch("logging.getLogger", side_effect=get_logger_side_effect)
+    mocks.stream_handler_cls = mocker.patch(
+        "logging.StreamHandler", return_value=mocks.stream_handler
+    )
+    mocks.file_handler_cls = mocker.patch("logging.FileHandler", return_value=mocks.file_handler)
+    mocker.patch("os.makedirs")
+    return mocks
 
 
-def test_setup_logging_with_file():
-    """Test logging setup with file output."""
-    test_log_file = "test.log"
-    mock_stream_handler = MagicMock()
-    mock_file_handler = MagicMock()
+def package_logger_calls(mocks):
+    """Return the getLogger calls made for package loggers, ignoring pytest's own."""
+    return [
+        c
+        for c in mocks.get_logger.call_args_list
+        if c.args and str(c.args[0]).startswith("datadog_healthcheck_deployer")
+    ]
 
-    with patch("logging.getLogger") as mock_get_logger, patch(
-        "logging.StreamHandler", return_value=mock_stream_handler
-    ), patch("logging.FileHandler", return_value=mock_file_handler), patch("os.makedirs"):
 
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
+def test_setup_logging(mock_logging):
+    """Test logging setup."""
+    setup_logging(level="INFO")
 
-        setup_logging(level="INFO", log_file=test_log_file)
+    mock_logging.stream_handler_cls.assert_called_once()
+    mock_logging.logger.addHandler.assert_called_once_with(mock_logging.stream_handler)
+    mock_logging.logger.setLevel.assert_called_once()
 
-        assert mock_logger.addHandler.call_count == 2
-        mock_logger.addHandler.assert_any_call(mock_stream_handler)
-        mock_logger.addHandler.assert_any_call(mock_file_handler)
 
+def test_setup_logging_with_file(mock_logging):
+    """Test logging setup with file output."""
+    setup_logging(level="INFO", log_file="test.log")
+
+    assert mock_logging.logger.addHandler.call_count == 2
+    mock_logging.logger.addHandler.assert_any_call(mock_logging.stream_handler)
+    mock_logging.logger.addHandler.assert_any_call(mock_logging.file_handler)
 
-def test_get_logger():
-    """Test logger retrieval."""
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
 
-        logger = get_logger("test")
-        mock_get_logger.assert_called_once_with("datadog_healthcheck_deployer.test")
-        assert logger == mock_logger
+def test_get_logger(mock_logging):
+    """Test logger retrieval."""
+    logger = get_logger("test")
+    assert package_logger_calls(mock_logging) == [call("datadog_healthcheck_deployer.test")]
+    assert logger == mock_logging.logger
 
 
-def test_logger_mixin():
+def test_logger_mixin(mock_logging):
     """Test logger mixin functionality."""
-    with patch("logging.getLogger") as mock_get_logger:
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
 
-        class TestClass(LoggerMixin):
-            pass
+    class TestClass(LoggerMixin):
+        pass
 
-        test_instance = TestClass()
-        assert test_instance.logger == mock_logger
-        mock_get_logger.assert_called_once_with("datadog_healthcheck_deployer.testclass")
+    test_instance = TestClass()
+    assert test_instance.logger == mock_logging.logger
+    assert package_logger_calls(mock_logging) == [call("datadog_healthcheck_deployer.testclass")]
 
 
 def test_log_call_decorator():
@@ -3,12 +3,13 @@
 import hashlib
 import json
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock
 
 import pytest
 import yaml
 
 from datadog_healthcheck_deployer.utils.utils import (
+    YamlLoader,
     calculate_hash,
     dump_yaml,
     format_timestamp,
@@ -20,15 +21,47 @@ from datadog_healthcheck_deployer.utils.utils import (
     substitute_variables,
 )
 
-
-def test_load_yaml_file():
+MERGE_CASES = [
+    (
+        {"a": 1, "b": {"c": 2}},
+        {"b": {"d": 3}, "e": 4},
+        {"a": 1, "b": {"c": 2, "d": 3}, "e": 4},
+    ),
+    ({"a": {"b": 1}}, {"a": 2}, {"a": 2}),
+]
+
+SUBSTITUTION_CASES = [
+    (
+        {
+            "string": "Hello ${name}",
+            "number": "${value}",
+            "list": ["${name}", "${value}"],
+            "nested": {"key": "${name}"},
+        },
+        {"name": "test", "value": 123},
+        {
+            "string": "Hello test",
+            "number": "123",
+            "list": ["test", "123"],
+            "nested": {"key": "test"},
+        },
+    ),
+    ({"key": "no references", "count": 1}, {"name": "test"}, {"key": "no references", "count": 1}),
+    (["${name}"], {}, ["${name}"]),
+]
+
+HASH_DATA = {"key": "value"}
+EXPECTED_HASH = hashlib.sha256(json.dumps(HASH_DATA, sort_keys=True).encode()).hexdigest()
+
+
+def test_load_yaml_file(tmp_path):
     """Test loading YAML from file."""
     test_data = {"key": "value"}
-    mock_file = mock_open(read_data=yaml.dump(test_data))
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_text(yaml.dump(test_data))
 
-    with patch("builtins.open", mock_file), patch("os.path.exists", return_value=True):
-        result = load_yaml("dummy.yaml")
-        assert result == test_data
+    result = load_yaml(str(yaml_file))
+    assert result == test_data
 
 
 def test_load_yaml_file_not_found():
@@ -37,58 +70,47 @@ def test_load_yaml_file_not_found():
         load_yaml("nonexistent.yaml")
 
 
-def test_dump_yaml():
+def test_dump_yaml(tmp_path):
     """Test dumping data to YAML file."""
     test_data = {"key": "value"}
-    mock_file = mock_open()
+    yaml_file = tmp_path / "output" / "test.yaml"
 
-    with patch("builtins.open", mock_file), patch("os.makedirs"):
-        dump_yaml(test_data, "test.yaml")
-        # The mock is called multiple times because yaml.dump writes line by line
-        assert mock_file().write.called
-        # Verify the content was written
-        written_content = "".join(call.args[0] for call in mock_file().write.call_args_list)
-        assert "key: value" in written_content
+    dump_yaml(test_data, str(yaml_file))
+    assert yaml.safe_load(yaml_file.read_text()) == test_data
 
 
-def test_merge_dicts():
+@pytest.mark.parametrize("dict1,dict2,expected", MERGE_CASES)
+def test_merge_dicts(dict1, dict2, expected):
     """Test dictionary merging."""
-    dict1 = {"a": 1, "b": {"c": 2}}
-    dict2 = {"b": {"d": 3}, "e": 4}
-    expected = {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
-
     result = merge_dicts(dict1, dict2)
     assert result == expected
 
 
-def test_substitute_variables():
+@pytest.mark.parametrize("data,variables,expected", SUBSTITUTION_CASES)
+def test_substitute_variables(data, variables, expected):
     """Test variable substitution in data."""
-    variables = {"name": "test", "value": 123}
-    data = {
-        "string": "Hello ${name}",
-        "number": "${value}",
-        "list": ["${name}", "${value}"],
-        "nested": {"key": "${name}"},
-    }
-
-    expected = {
-        "string": "Hello test",
-        "number": "123",
-        "list": ["test", "123"],
-        "nested": {"key": "test"},
-    }
-
     result = substitute_variables(data, variables)
     assert result == expected
 
 
+def test_substitute_variables_shared_and_cyclic():
+    """Test aliased and self-referencing containers are copied once."""
+    data = yaml.load('a: &x ["${v}", *x]\nb: &y {k: "${v}"}\nc: *y', Loader=YamlLoader)
+    result = substitute_variables(data, {"v": 1})
+
+    assert result["a"][0] == "1"
+    assert result["a"][1] is result["a"]
+    assert result["b"] == {"k": "1"}
+    assert result["c"] is result["b"]
+    # Input is left untouched
+    assert data["a"][0] == "${v}"
+    assert data["b"] == {"k": "${v}"}
+
+
 def test_calculate_hash():
     """Test hash calculation."""
-    test_data = {"key": "value"}
-    expected_hash = hashlib.sha256(json.dumps(test_data, sort_keys=True).encode()).hexdigest()
-
-    result = calculate_hash(test_data)
-    assert result == expected_hash
+    result = calculate_hash(HASH_DATA)
+    assert result == EXPECTED_HASH
 
 
 def test_retry_with_backoff_success():
@@ -99,43 +121,49 @@ def test_retry_with_backoff_success():
     assert mock_func.call_count == 1
 
 
-def test_retry_with_backoff_failure():
+def test_retry_with_backoff_failure(mocker):
     """Test retry mechanism with all attempts failing."""
+    mock_sleep = mocker.patch("time.sleep")
     mock_func = MagicMock(side_effect=Exception("Test error"))
 
     with pytest.raises(Exception):
-        retry_with_backoff(mock_func, max_attempts=3, base_delay=0.1)
+        retry_with_backoff(mock_func, max_attempts=3)
     assert mock_func.call_count == 3
+    # Backs off between attempts but not after the last one
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
 
 
-def test_format_timestamp():
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2024, 1, 1, tzinfo=timezone.utc),  # datetime object
+        1704067200,  # epoch seconds
+        "2024-01-01T00:00:00Z",  # ISO string
+    ],
+)
+def test_format_timestamp(timestamp):
     """Test timestamp formatting."""
-    # Test with datetime object
-    dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    assert format_timestamp(dt) == "2024-01-01T00:00:00+00:00"
-
-    # Test with timestamp
-    assert format_timestamp(1704067200) == "2024-01-01T00:00:00+00:00"
+    assert format_timestamp(timestamp) == "2024-01-01T00:00:00+00:00"
 
-    # Test with ISO string
-    assert format_timestamp("2024-01-01T00:00:00Z") == "2024-01-01T00:00:00+00:00"
 
-
-def test_parse_duration():
+@pytest.mark.parametrize(
+    "duration,seconds",
+    [("60s", 60), ("5m", 300), ("2h", 7200), ("1d", 86400), ("1w", 604800)],
+)
+def test_parse_duration(duration, seconds):
     """Test duration string parsing."""
-    assert parse_duration("60s") == 60
-    assert parse_duration("5m") == 300
-    assert parse_duration("2h") == 7200
-    assert parse_duration("1d") == 86400
-    assert parse_duration("1w") == 604800
+    assert parse_duration(duration) == seconds
+
 
+def test_parse_duration_invalid():
+    """Test parsing an invalid duration string."""
     with pytest.raises(ValueError):
         parse_duration("invalid")
 
 
-@patch("requests.request")
-def test_make_request(mock_request):
+def test_make_request(mocker):
     """Test HTTP request making."""
+    mock_request = mocker.patch("requests.request")
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
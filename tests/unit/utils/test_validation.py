@@ -2,6 +2,7 @@
 
 import socket
 import ssl
+import time
 from unittest.mock import MagicMock, patch
 
 import dns.resolver
@@ -9,6 +10,8 @@ import pytest
 
 from datadog_healthcheck_deployer.utils.exceptions import ValidationError
 from datadog_healthcheck_deployer.utils.validation import (
+    clear_network_caches,
+    compile_pattern,
     validate_check_type,
     validate_content_match,
     validate_dns_record,
@@ -18,6 +21,7 @@ from datadog_healthcheck_deployer.utils.validation import (
     validate_monitor_config,
     validate_monitor_state,
     validate_monitor_type,
+    validate_network_batch,
     validate_notification_channel,
     validate_notify_type,
     validate_ssl_certificate,
@@ -30,6 +34,14 @@ from datadog_healthcheck_deployer.utils.validation import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_validation_caches():
+    """Start every test with empty network validation caches."""
+    clear_network_caches()
+    yield
+    clear_network_caches()
+
+
 def test_validate_check_type():
     """Test check type validation."""
     validate_check_type("http")  # Should not raise
@@ -95,6 +107,14 @@ def test_validate_tags():
     with pytest.raises(ValidationError):
         validate_tags(invalid_tags)
 
+    with pytest.raises(ValidationError, match="Invalid tag key format: Team"):
+        validate_tags({**valid_tags, "Team": "sre"})
+    with pytest.raises(ValidationError, match="Invalid tag value format: a b"):
+        validate_tags({**valid_tags, "team": "a b"})
+    # A newline inside a value must not pass as two valid tags
+    with pytest.raises(ValidationError, match="Invalid tag value format"):
+        validate_tags({**valid_tags, "team": "sre\nops"})
+
 
 def test_validate_interval():
     """Test interval validation."""
@@ -112,8 +132,22 @@ def test_validate_url():
     """Test URL validation."""
     validate_url("https://example.com")  # Should not raise
 
-    with pytest.raises(ValidationError):
-        validate_url("invalid")
+    validate_url("ftp://files.example.com:21/path?q=1")  # Should not raise
+
+    # Same acceptance as urlparse: leading whitespace is stripped and bytes are decoded
+    validate_url(" https://example.com")  # Should not raise
+    validate_url(b"http://example.com")  # Should not raise
+
+    for url in (
+        "invalid",
+        "http://",
+        "http:///path",
+        "//example.com",
+        "mailto:a@example.com",
+        "http://[::1",
+    ):
+        with pytest.raises(ValidationError):
+            validate_url(url)
 
 
 @patch("socket.create_connection")
@@ -124,12 +158,13 @@ def test_validate_ssl_certificate(mock_context, mock_connection):
     mock_sock = MagicMock()
     mock_ssock = MagicMock()
     mock_ssock.getpeercert.return_value = {"subject": [("CN", "example.com")]}
-    mock_context.return_value.wrap_socket.return_value = mock_ssock
+    mock_context.return_value.wrap_socket.return_value.__enter__.return_value = mock_ssock
     mock_connection.return_value = mock_sock
 
     validate_ssl_certificate("example.com")  # Should not raise
 
     # Test validation failure
+    clear_network_caches()
     mock_context.return_value.wrap_socket.side_effect = ssl.SSLError(
         "Certificate validation failed"
     )
@@ -137,6 +172,49 @@ def test_validate_ssl_certificate(mock_context, mock_connection):
         validate_ssl_certificate("example.com")
 
 
+@patch("socket.create_connection")
+@patch("ssl.create_default_context")
+def test_validate_ssl_certificate_cached(mock_context, mock_connection):
+    """Test SSL certificate results are cached until the TTL or expiry passes."""
+    mock_ssock = MagicMock()
+    mock_ssock.getpeercert.return_value = {"notAfter": "Jan  1 00:00:00 2100 GMT"}
+    mock_context.return_value.wrap_socket.return_value.__enter__.return_value = mock_ssock
+
+    validate_ssl_certificate("example.com")
+    validate_ssl_certificate("example.com")
+    assert mock_connection.call_count == 1
+
+    # Zero TTL forces a new handshake
+    validate_ssl_certificate("example.org", ttl=0)
+    validate_ssl_certificate("example.org", ttl=0)
+    assert mock_connection.call_count == 3
+
+    # A certificate that expired since it was cached fails without reconnecting
+    clear_network_caches()
+    mock_ssock.getpeercert.return_value = {"notAfter": "Jan  1 00:00:00 2000 GMT"}
+    validate_ssl_certificate("example.com")
+    with pytest.raises(ValidationError, match="has expired"):
+        validate_ssl_certificate("example.com")
+    assert mock_connection.call_count == 4
+
+
+@patch("socket.create_connection")
+@patch("ssl.create_default_context")
+def test_validate_ssl_certificate_reuses_context(mock_context, mock_connection):
+    """Test the SSL context is shared and sessions are offered for resumption."""
+    wrap_socket = mock_context.return_value.wrap_socket
+    mock_ssock = wrap_socket.return_value.__enter__.return_value
+    mock_ssock.getpeercert.return_value = {"subject": [("CN", "example.com")]}
+
+    validate_ssl_certificate("example.com", ttl=0)
+    validate_ssl_certificate("example.com", ttl=0)
+    validate_ssl_certificate("example.org", ttl=0)
+
+    assert mock_context.call_count == 1
+    sessions = [c.kwargs["session"] for c in wrap_socket.call_args_list]
+    assert sessions == [None, mock_ssock.session, None]
+
+
 @patch("dns.resolver.Resolver")
 def test_validate_dns_record(mock_resolver):
     """Test DNS record validation."""
@@ -149,6 +227,33 @@ def test_validate_dns_record(mock_resolver):
         validate_dns_record("invalid.com")
 
 
+@patch("dns.resolver.Resolver")
+def test_validate_dns_record_cached(mock_resolver):
+    """Test DNS results are cached and the resolver is shared."""
+    query = mock_resolver.return_value.query
+    query.return_value = MagicMock(rrset=MagicMock(ttl=60))
+
+    validate_dns_record("example.com")
+    validate_dns_record("example.com")
+    validate_dns_record("example.com", "MX")
+    assert query.call_count == 2
+    assert mock_resolver.call_count == 1
+
+    # Missing names are cached too
+    query.side_effect = dns.resolver.NXDOMAIN
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_dns_record("invalid.com")
+    assert query.call_count == 3
+
+    # Other failures are retried
+    query.side_effect = dns.resolver.Timeout
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_dns_record("slow.com")
+    assert query.call_count == 5
+
+
 @patch("socket.create_connection")
 def test_validate_tcp_connection(mock_connection):
     """Test TCP connection validation."""
@@ -159,6 +264,48 @@ def test_validate_tcp_connection(mock_connection):
         validate_tcp_connection("invalid", 80)
 
 
+@patch("socket.create_connection")
+@patch("dns.resolver.Resolver")
+def test_validate_network_batch(mock_resolver, mock_connection):
+    """Test batched network validation."""
+    mock_resolver.return_value.query.return_value = []
+    validate_network_batch([])  # Should not raise
+    validate_network_batch(
+        [("dns", "example.com", "A"), ("tcp", "example.com", 80), ("tcp", "example.org", 443)]
+    )
+    assert mock_connection.call_count == 2
+
+    def connect(address, *args, **kwargs):
+        host = address[0]
+        if host in failing:
+            if host == "a.com":
+                time.sleep(0.05)  # Fail last, so completion order differs from input order
+            raise socket.error(f"{host} unreachable")
+        return MagicMock()
+
+    failing = {"b.com"}
+    mock_connection.side_effect = connect
+    with pytest.raises(ValidationError, match="b.com:80"):
+        validate_network_batch([("tcp", "a.com", 80), ("tcp", "b.com", 80)])
+
+    # With several failures the first failing item in input order is reported
+    failing = {"a.com", "b.com"}
+    with pytest.raises(ValidationError, match="a.com:80"):
+        validate_network_batch([("tcp", "a.com", 80), ("tcp", "b.com", 80)])
+
+    with pytest.raises(ValidationError, match="Invalid network validation type"):
+        validate_network_batch([("icmp", "example.com")])
+
+
+def test_compile_pattern():
+    """Test compiled patterns are reused."""
+    compile_pattern.cache_clear()
+    pattern = compile_pattern(r"^test-[a-z]+$")
+    assert pattern.match("test-abc")
+    assert compile_pattern(r"^test-[a-z]+$") is pattern
+    assert compile_pattern.cache_info().hits == 1
+
+
 def test_validate_content_match():
     """Test content match validation."""
     validate_content_match(r"test.*")  # Should not raise
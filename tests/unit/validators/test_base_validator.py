@@ -24,7 +24,7 @@ class SimpleValidator(BaseValidator):
         return ["test"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
     """Create a validator instance."""
     schema = {
@@ -55,6 +55,20 @@ def test_validate_required_fields(validator):
     with pytest.raises(ValidationError, match="'missing' is a required property"):
         validator._validate_required_fields(data, ["missing"])
 
+    # Defaults to the schema's required fields; the first missing one is reported
+    validator._validate_required_fields(data)
+    with pytest.raises(ValidationError, match="'test' is a required property"):
+        validator._validate_required_fields({})
+    with pytest.raises(ValidationError, match="'first' is a required property"):
+        validator._validate_required_fields(data, ["test", "first", "second"])
+
+
+@pytest.mark.parametrize("data", ["just a string", ["a"], [{"a": 1}]])
+def test_validate_non_mapping_data(validator, data):
+    """Test non-mapping input is reported as missing required fields."""
+    with pytest.raises(ValidationError, match="'test' is a required property"):
+        validator.validate(data)
+
 
 def test_validate_field_type(validator):
     """Test field type validation."""
@@ -83,6 +97,13 @@ def test_validate_range(validator):
     with pytest.raises(ValidationError, match="must be <="):
         validator._validate_range(101, 0, 100, "range_field")
 
+    # Single or no bounds
+    validator._validate_range(-5, maximum=0, field="range_field")
+    validator._validate_range(5, minimum=0, field="range_field")
+    validator._validate_range(5, field="range_field")
+    with pytest.raises(ValidationError, match="must be <= 0"):
+        validator._validate_range(1, maximum=0, field="range_field")
+
 
 def test_validate_string_length(validator):
     """Test string length validation."""
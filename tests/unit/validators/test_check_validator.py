@@ -6,7 +6,7 @@ from datadog_healthcheck_deployer.utils.exceptions import ValidationError
 from datadog_healthcheck_deployer.validators.check_validator import CheckValidator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
     """Create a check validator instance."""
     return CheckValidator()
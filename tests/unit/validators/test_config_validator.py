@@ -6,7 +6,7 @@ from datadog_healthcheck_deployer.utils.exceptions import ValidationError
 from datadog_healthcheck_deployer.validators.config_validator import ConfigValidator
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
     """Create a config validator instance."""
     return ConfigValidator()
@@ -1,12 +1,39 @@
 """Tests for dashboard validator implementation."""
 
+import copy
+
 import pytest
 
 from datadog_healthcheck_deployer.utils.exceptions import ValidationError
 from datadog_healthcheck_deployer.validators.dashboard_validator import DashboardValidator
 
+VALID_CONFIG = {
+    "title": "Test Dashboard",
+    "description": "Test description",
+    "layout_type": "ordered",
+    "widgets": [
+        {
+            "title": "Widget 1",
+            "type": "timeseries",
+            "query": "avg:system.cpu.user{*}",
+        },
+        {
+            "title": "Widget 2",
+            "type": "query_value",
+            "query": "avg:system.memory.used{*}",
+        },
+    ],
+    "template_variables": [
+        {
+            "name": "env",
+            "prefix": "environment",
+            "default": "*",
+        },
+    ],
+}
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validator():
     """Create a dashboard validator instance."""
     return DashboardValidator()
@@ -14,31 +41,8 @@ def validator():
 
 @pytest.fixture
 def valid_config():
-    """Create a valid dashboard configuration."""
-    return {
-        "title": "Test Dashboard",
-        "description": "Test description",
-        "layout_type": "ordered",
-        "widgets": [
-            {
-                "title": "Widget 1",
-                "type": "timeseries",
-                "query": "avg:system.cpu.user{*}",
-            },
-            {
-                "title": "Widget 2",
-                "type": "query_value",
-                "query": "avg:system.memory.used{*}",
-            },
-        ],
-        "template_variables": [
-            {
-                "name": "env",
-                "prefix": "environment",
-                "default": "*",
-            },
-        ],
-    }
+    """Create a copy of the valid dashboard configuration that tests may mutate."""
+    return copy.deepcopy(VALID_CONFIG)
 
 
 def test_validator_initialization(validator):
@@ -55,18 +59,16 @@ def test_validate_valid_config(validator, valid_config):
     validator.validate(valid_config)  # Should not raise
 
 
-def test_validate_missing_title(validator, valid_config):
+def test_validate_missing_title(validator):
     """Test validation with missing title."""
-    config = valid_config.copy()
-    del config["title"]  # Remove title field
+    config = {key: value for key, value in VALID_CONFIG.items() if key != "title"}
     with pytest.raises(ValidationError, match="'title' is a required property"):
         validator.validate(config)
 
 
-def test_validate_invalid_layout_type(validator, valid_config):
+def test_validate_invalid_layout_type(validator):
     """Test validation with invalid layout type."""
-    config = valid_config.copy()
-    config["layout_type"] = "invalid"
+    config = {**VALID_CONFIG, "layout_type": "invalid"}
     with pytest.raises(ValidationError, match="'invalid' is not one of"):
         validator.validate(config)
 
@@ -1,12 +1,30 @@
 """Tests for monitor validator implementation."""
 
+import copy
+
 import pytest
 
 from datadog_healthcheck_deployer.utils.exceptions import ValidationError
 from datadog_healthcheck_deployer.validators.monitor_validator import MonitorValidator
 
+VALID_CONFIG = {
+    "name": "test-monitor",
+    "type": "metric alert",
+    "query": "avg:system.cpu.user{*}",
+    "message": "CPU usage is high",
+    "tags": {"env": "prod", "service": "api"},
+    "options": {
+        "timeout_h": 24,
+        "renotify_interval": 60,
+        "thresholds": {
+            "critical": 90,
+            "warning": 80,
+        },
+    },
+}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def validator():
     """Create a monitor validator instance."""
     return MonitorValidator()
@@ -14,22 +32,8 @@ def validator():
 
 @pytest.fixture
 def valid_config():
-    """Create a valid monitor configuration."""
-    return {
-        "name": "test-monitor",
-        "type": "metric alert",
-        "query": "avg:system.cpu.user{*}",
-        "message": "CPU usage is high",
-        "tags": {"env": "prod", "service": "api"},
-        "options": {
-            "timeout_h": 24,
-            "renotify_interval": 60,
-            "thresholds": {
-                "critical": 90,
-                "warning": 80,
-            },
-        },
-    }
+    """Create a copy of the valid monitor configuration that tests may mutate."""
+    return copy.deepcopy(VALID_CONFIG)
 
 
 def test_validator_initialization(validator):
@@ -48,28 +52,33 @@ def test_validate_valid_config(validator, valid_config):
     validator.validate(valid_config)  # Should not raise
 
 
-def test_validate_missing_required_fields(validator, valid_config):
+@pytest.mark.parametrize(
+    "missing, expected",
+    [
+        (("name",), "'name' is a required property"),
+        (("type",), "'type' is a required property"),
+        (("query",), "'query' is a required property"),
+        # The first missing field in schema order is reported
+        (("type", "query"), "'type' is a required property"),
+    ],
+)
+def test_validate_missing_required_fields(validator, missing, expected):
     """Test validation with missing required fields."""
-    invalid_config = {
-        "name": "test-monitor",
-        # Missing type and query
-    }
-    with pytest.raises(ValidationError, match="'type' is a required property"):
+    invalid_config = {key: value for key, value in VALID_CONFIG.items() if key not in missing}
+    with pytest.raises(ValidationError, match=expected):
         validator.validate(invalid_config)
 
 
-def test_validate_invalid_monitor_type(validator, valid_config):
+def test_validate_invalid_monitor_type(validator):
     """Test validation with invalid monitor type."""
-    config = valid_config.copy()
-    config["type"] = "invalid_type"
+    config = {**VALID_CONFIG, "type": "invalid_type"}
     with pytest.raises(ValidationError, match="'invalid_type' is not one of"):
         validator.validate(config)
 
 
-def test_validate_thresholds(validator, valid_config):
+def test_validate_thresholds(validator):
     """Test threshold validation."""
-    config = valid_config.copy()
-    config["options"] = {"thresholds": {"critical": "invalid"}}
+    config = {**VALID_CONFIG, "options": {"thresholds": {"critical": "invalid"}}}
     with pytest.raises(ValidationError, match="Invalid threshold value"):
         validator.validate(config)
 